@@ -14,14 +14,21 @@ from __future__ import annotations
 import os
 import re
 import sys
+import json
+import time
+import shutil
 import string
 import datetime
 import functools
+import threading
+import collections
+import email.utils
 import unicodedata
+import concurrent.futures
 from pathlib import Path
 from dataclasses import field, fields, dataclass
 
-from typing import Any, Mapping, Iterable, Iterator, Sequence, Collection
+from typing import Any, Mapping, Callable, Iterable, Iterator, Sequence, Collection
 
 try:
     from typing import Self
@@ -32,27 +39,47 @@ except ImportError:
 import jinja2
 import requests
 import urllib3.util
-import dateutil.parser
 
-EXCLUDE_VERSIONS = ['2.0.0', '2.1.2', '3.0.0', '3.1.0', '3.2.0', '4.0.0']
+EXCLUDE_VERSIONS = frozenset({'2.0.0', '2.1.2', '3.0.0', '3.1.0', '3.2.0', '4.0.0'})
+
+# only found in '# Newly assigned in Unicode X.Y.Z' comments of DerivedAge.txt. Beginning with
+# a literal, rather than '^#.*', lets the regex engine quickly search for it, like str.find().
+PATTERN_ASSIGNED_VERSION = re.compile(r'assigned in Unicode ([0-9.]+)', re.ASCII)
+PATTERN_DATA_FILENAME = re.compile(
+    r'^(emoji-variation-sequences|DerivedGeneralCategory|EastAsianWidth)-(\d+)\.(\d+)\.(\d+)\.txt$',
+    re.ASCII)
 
 PATH_UP = os.path.relpath(os.path.join(os.path.dirname(__file__), os.path.pardir))
 PATH_DATA = os.path.join(PATH_UP, 'data')
 PATH_TESTS = os.path.join(PATH_UP, 'tests')
+PATH_DOCS = os.path.join(PATH_UP, 'docs')
+PATH_WCWIDTH = os.path.join(PATH_UP, 'wcwidth')
+PATH_CODE_TEMPLATES = os.path.join(PATH_UP, 'code_templates')
+PATH_LAST_MODIFIED = os.path.join(PATH_DATA, 'last-modified.json')
+PATH_JINJA_CACHE = os.path.join(PATH_UP, '.jinja_cache')
 # "wcwidth/bin/update-tables.py", even on Windows
 # not really a path, if the git repo isn't named "wcwidth"
 THIS_FILEPATH = ('wcwidth/' +
                  Path(__file__).resolve().relative_to(Path(PATH_UP).resolve()).as_posix())
 
+# compiled templates are persisted to PATH_JINJA_CACHE, so that repeated runs
+# of 'tox -e update' skip the lex, parse, and compile steps of jinja2.
+os.makedirs(PATH_JINJA_CACHE, exist_ok=True)
 JINJA_ENV = jinja2.Environment(
-    loader=jinja2.FileSystemLoader(os.path.join(PATH_UP, 'code_templates')),
-    keep_trailing_newline=True)
-UTC_NOW = datetime.datetime.now(datetime.UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
+    loader=jinja2.FileSystemLoader(PATH_CODE_TEMPLATES),
+    bytecode_cache=jinja2.FileSystemBytecodeCache(directory=PATH_JINJA_CACHE),
+    keep_trailing_newline=True,
+    # templates do not change during a run, skip checking their modification time
+    auto_reload=False)
+# matches utc_now() of previously generated files
+PATTERN_UTC_NOW = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} UTC', re.ASCII)
 
 CONNECT_TIMEOUT = int(os.environ.get('CONNECT_TIMEOUT', '10'))
-FETCH_BLOCKSIZE = int(os.environ.get('FETCH_BLOCKSIZE', '4096'))
+FETCH_BLOCKSIZE = int(os.environ.get('FETCH_BLOCKSIZE', '65536'))
 MAX_RETRIES = int(os.environ.get('MAX_RETRIES', '6'))
 BACKOFF_FACTOR = float(os.environ.get('BACKOFF_FACTOR', '0.1'))
+MAX_WORKERS = int(os.environ.get('MAX_WORKERS', '8'))
+LAST_MODIFIED_TTL = int(os.environ.get('LAST_MODIFIED_TTL', '86400'))
 
 # Hangul Jamo is a decomposed form of Hangul Syllables, see
 # see https://www.unicode.org/faq/korean.html#3
@@ -63,29 +90,111 @@ BACKOFF_FACTOR = float(os.environ.get('BACKOFF_FACTOR', '0.1'))
 #  consonant, Vowel, Trailing consonant). A Hangul Syllable consists of
 #  <LV> or <LVT> sequences."
 HANGUL_JAMO_ZEROWIDTH = (
-    *range(0x1160, 0x1200),  # Hangul Jungseong Filler .. Hangul Jongseong Ssangnieun
-    *range(0xD7B0, 0xD800),  # Hangul Jungseong O-Yeo  .. Undefined Character of Hangul Jamo Extended-B
+    (0x1160, 0x11FF),  # Hangul Jungseong Filler .. Hangul Jongseong Ssangnieun
+    (0xD7B0, 0xD7FF),  # Hangul Jungseong O-Yeo  .. Undefined Character of Hangul Jamo Extended-B
 )
 
 
-def _bisearch(ucs, table):
-    """A copy of wcwwidth._bisearch, to prevent having issues when depending on code that imports
-    our generated code."""
-    lbound = 0
-    ubound = len(table) - 1
-
-    if ucs < table[0][0] or ucs > table[ubound][1]:
-        return 0
-    while ubound >= lbound:
-        mid = (lbound + ubound) // 2
-        if ucs > table[mid][1]:
-            lbound = mid + 1
-        elif ucs < table[mid][0]:
-            ubound = mid - 1
+# Me Enclosing Mark
+# Mn Nonspacing Mark
+# Mc Spacing Mark
+# Cf Format
+# Zl Line Separator
+# Zp Paragraph Separator
+CATEGORIES_ZERO_WIDTH = frozenset({'Me', 'Mn', 'Mc', 'Cf', 'Zl', 'Zp'})
+# F  Fullwidth
+# W  Wide
+CATEGORIES_WIDE = frozenset({'W', 'F'})
+# '<start>[..<end>] ; <property> # <comment>' data lines of DerivedGeneralCategory.txt and
+# EastAsianWidth.txt, only of zero and wide categories, and 'Sk', which may be either. No table
+# of narrow characters is generated, so that the scan skips the many lines of narrow ones.
+PATTERN_DATA_LINE_NOT_NARROW = re.compile(
+    r'^([0-9A-F]+)(?:\.\.([0-9A-F]+))?\s*;\s*('
+    + '|'.join(sorted(CATEGORIES_ZERO_WIDTH | CATEGORIES_WIDE | {'Sk'}))
+    + r')\b[^#\n]*(?:#(.*))?', re.MULTILINE | re.ASCII)
+
+
+def cache_concurrent(func: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Like functools.cache, but also safe for concurrent threads.
+
+    A concurrent call with the same arguments waits for the result of the first call, rather than
+    computing it again.
+    """
+    results: dict[tuple[Any, ...], Any] = {}
+    locks: dict[tuple[Any, ...], threading.Lock] = collections.defaultdict(threading.Lock)
+    locks_lock = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = (*args, *sorted(kwargs.items()))
+        with locks_lock:
+            lock = locks[key]
+        with lock:
+            if key not in results:
+                results[key] = func(*args, **kwargs)
+        return results[key]
+    return wrapper
+
+
+@cache_concurrent
+def utc_now() -> str:
+    """Return time of generation, the same for every file written by this run."""
+    return datetime.datetime.now(datetime.UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
+def merge_ranges(ranges: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Return sorted list of (start, end) ranges, joining those that overlap or are adjacent.
+
+    Both 'start' and 'end' are inclusive, matching the tables of wcwidth.
+
+    >>> merge_ranges([(7, 8), (1, 2), (3, 3), (5, 5), (8, 8)])
+    [(1, 3), (5, 5), (7, 8)]
+    """
+    table: list[tuple[int, int]] = []
+    ranges_iter = iter(sorted(ranges))
+    start, end = next(ranges_iter, (None, None))
+    if start is None:
+        return table
+
+    for range_start, range_end in ranges_iter:
+        if range_start <= end + 1:
+            # continuation of existing range
+            end = max(end, range_end)
         else:
-            return 1
+            # non-continuation: emit previous range, and start a new one
+            table.append((start, end))
+            start, end = range_start, range_end
+    table.append((start, end))
+    return table
 
-    return 0
+
+def subtract_ranges(ranges: Iterable[tuple[int, int]],
+                    other: Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Return sorted list of (start, end) ranges, without any values of 'other' ranges.
+
+    >>> subtract_ranges([(1, 10), (20, 30)], [(3, 4), (8, 22), (30, 40)])
+    [(1, 2), (5, 7), (23, 29)]
+    """
+    other = merge_ranges(other)
+    table: list[tuple[int, int]] = []
+    idx = 0
+    for start, end in merge_ranges(ranges):
+        # skip past 'other' ranges that end before this one,
+        while idx < len(other) and other[idx][1] < start:
+            idx += 1
+        # and split this range around any that overlap it
+        jdx = idx
+        while jdx < len(other) and other[jdx][0] <= end:
+            if other[jdx][0] > start:
+                table.append((start, other[jdx][0] - 1))
+            start = other[jdx][1] + 1
+            jdx += 1
+        if start <= end:
+            table.append((start, end))
+    return table
 
 
 @dataclass(order=True, frozen=True)
@@ -120,95 +229,74 @@ class UnicodeVersion:
 
 @dataclass(frozen=True)
 class TableEntry:
-    """An entry of a unicode table."""
+    """
+    An entry of a unicode table.
+
+    Both 'start' and 'end' of 'code_range' are inclusive, as in :meth:`TableDef.as_value_ranges`.
+    """
     code_range: tuple[int, int] | None
     properties: tuple[str, ...]
     comment: str
 
-    def filter_by_category_width(self, wide: int) -> bool:
+    def category_width(self) -> int:
         """
-        Return whether entry matches displayed width.
+        Return displayed width of entry by its category.
 
         Parses both DerivedGeneralCategory.txt and EastAsianWidth.txt
         """
-        if self.code_range is None:
-            return False
-        elif self.properties[0] == 'Sk':
-            if 'EMOJI MODIFIER' in self.comment:
-                # These codepoints are fullwidth when used without emoji, 0-width with.
-                # Generate code that expects the best case, that is always combined
-                return wide == 0
-            elif 'FULLWIDTH' in self.comment:
-                # Some codepoints in 'Sk' categories are fullwidth(!)
-                # at this time just 3, FULLWIDTH: CIRCUMFLEX ACCENT, GRAVE ACCENT, and MACRON
-                return wide == 2
-            else:
-                # the rest are narrow
-                return wide == 1
-        # Me Enclosing Mark
-        # Mn Nonspacing Mark
-        # Cf Format
-        # Zl Line Separator
-        # Zp Paragraph Separator
-        if self.properties[0] in ('Me', 'Mn', 'Mc', 'Cf', 'Zl', 'Zp'):
-            return wide == 0
-        # F  Fullwidth
-        # W  Wide
-        if self.properties[0] in ('W', 'F'):
-            return wide == 2
-        return wide == 1
+        category = self.properties[0]
+        if category in CATEGORIES_ZERO_WIDTH:
+            return 0
+        if category in CATEGORIES_WIDE:
+            return 2
+        if category != 'Sk':
+            return 1
+        # only 'Sk' entries need their comment inspected
+        if 'EMOJI MODIFIER' in self.comment:
+            # These codepoints are fullwidth when used without emoji, 0-width with.
+            # Generate code that expects the best case, that is always combined
+            return 0
+        if 'FULLWIDTH' in self.comment:
+            # Some codepoints in 'Sk' categories are fullwidth(!)
+            # at this time just 3, FULLWIDTH: CIRCUMFLEX ACCENT, GRAVE ACCENT, and MACRON
+            return 2
+        # the rest are narrow
+        return 1
 
     @staticmethod
-    def parse_width_category_values(table_iter: Iterator[TableEntry],
-                                    wide: int) -> set[tuple[int, int]]:
-        """Parse value ranges of unicode data files, by given category and width."""
-        return {n
-                for entry in table_iter
-                if entry.filter_by_category_width(wide)
-                for n in list(range(entry.code_range[0], entry.code_range[1]))}
+    def parse_width_category_values(
+            table_iter: Iterator[TableEntry]) -> dict[int, list[tuple[int, int]]]:
+        """Parse value ranges of unicode data files, keyed by displayed width of category."""
+        values: dict[int, list[tuple[int, int]]] = {0: [], 1: [], 2: []}
+        for entry in table_iter:
+            if entry.code_range is not None:
+                values[entry.category_width()].append(entry.code_range)
+        return values
 
 
 @dataclass
 class TableDef:
     filename: str
     date: str
-    values: set[int]
+    values: list[tuple[int, int]]
+
+    def copy(self) -> TableDef:
+        """
+        Return a copy, with a new list of 'values'.
+
+        Results of :func:`parse_category` are cached and shared, they must be copied before
+        modification.
+        """
+        return TableDef(self.filename, self.date, list(self.values))
 
     def as_value_ranges(self) -> list[tuple[int, int]]:
-        """Return a list of tuple of (start, end) ranges for given set of 'values'."""
-        table: list[tuple[int, int]] = []
-        values_iter = iter(sorted(self.values))
-        start = end = next(values_iter)
-        table.append((start, end))
-
-        for value in values_iter:
-            # remove last-most entry for comparison,
-            start, end = table.pop()
-            if end == value - 1:
-                # continuation of existing range, rewrite
-                table.append((start, value,))
-            else:
-                # non-continuation: insert back previous range,
-                table.append((start, end,))
-                # and start a new one
-                table.append((value, value,))
-        return table
+        """Return a sorted list of tuple of (start, end) ranges, joined from given 'values'."""
+        return merge_ranges(self.values)
 
     @property
     def hex_range_descriptions(self) -> list[tuple[str, str, str]]:
         """Convert integers into string table of (hex_start, hex_end, txt_description)."""
-        pytable_values: list[tuple[str, str, str]] = []
-        for start, end in self.as_value_ranges():
-            hex_start, hex_end = f'0x{start:05x}', f'0x{end:05x}'
-            ucs_start, ucs_end = chr(start), chr(end)
-            name_start = name_ucs(ucs_start) or '(nil)'
-            name_end = name_ucs(ucs_end) or '(nil)'
-            if name_start != name_end:
-                txt_description = f'{name_start[:24].rstrip():24s}..{name_end[:24].rstrip()}'
-            else:
-                txt_description = f'{name_start[:48]}'
-            pytable_values.append((hex_start, hex_end, txt_description))
-        return pytable_values
+        return [hex_range_description(start, end) for start, end in self.as_value_ranges()]
 
 
 @dataclass(frozen=True)
@@ -234,6 +322,12 @@ class UnicodeTableRenderCtx(RenderContext):
     table: Mapping[UnicodeVersion, TableDef]
 
 
+@cache_concurrent
+def get_template(jinja_filename: str) -> jinja2.Template:
+    """Load template just once, even when the same template is rendered by concurrent threads."""
+    return JINJA_ENV.get_template(jinja_filename)
+
+
 @dataclass
 class RenderDefinition:
     """Base class, do not instantiate it directly."""
@@ -245,9 +339,9 @@ class RenderDefinition:
     _render_context: dict[str, Any] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        self._template = JINJA_ENV.get_template(self.jinja_filename)
+        self._template = get_template(self.jinja_filename)
         self._render_context = {
-            'utc_now': UTC_NOW,
+            'utc_now': utc_now(),
             'this_filepath': THIS_FILEPATH,
             **self.render_context.to_dict(),
         }
@@ -269,7 +363,7 @@ class UnicodeVersionPyRenderDef(RenderDefinition):
     def new(cls, context: UnicodeVersionPyRenderCtx) -> Self:
         return cls(
             jinja_filename='unicode_versions.py.j2',
-            output_filename=os.path.join(PATH_UP, 'wcwidth', 'unicode_versions.py'),
+            output_filename=os.path.join(PATH_WCWIDTH, 'unicode_versions.py'),
             render_context=context,
         )
 
@@ -282,7 +376,7 @@ class UnicodeVersionRstRenderDef(RenderDefinition):
     def new(cls, context: UnicodeVersionRstRenderCtx) -> Self:
         return cls(
             jinja_filename='unicode_version.rst.j2',
-            output_filename=os.path.join(PATH_UP, 'docs', 'unicode_version.rst'),
+            output_filename=os.path.join(PATH_DOCS, 'unicode_version.rst'),
             render_context=context,
         )
 
@@ -304,7 +398,7 @@ class UnicodeTableRenderDef(RenderDefinition):
 
         return cls(
             jinja_filename=jinja_filename,
-            output_filename=os.path.join(PATH_UP, 'wcwidth', filename),
+            output_filename=os.path.join(PATH_WCWIDTH, filename),
             render_context=context,
         )
 
@@ -312,16 +406,12 @@ class UnicodeTableRenderDef(RenderDefinition):
 @functools.cache
 def fetch_unicode_versions() -> list[UnicodeVersion]:
     """Fetch, determine, and return Unicode Versions for processing."""
-    pattern = re.compile(r'#.*assigned in Unicode ([0-9.]+)')
-    versions: list[UnicodeVersion] = []
     with open(UnicodeDataFile.DerivedAge(), encoding='utf-8') as f:
-        for line in f:
-            if match := re.match(pattern, line):
-                version = match.group(1)
-                if version not in EXCLUDE_VERSIONS:
-                    versions.append(UnicodeVersion.parse(version))
-    versions.sort()
-    return versions
+        # a single scan of the whole file finds the few lines of interest
+        matches = PATTERN_ASSIGNED_VERSION.findall(f.read())
+    return sorted(UnicodeVersion.parse(version)
+                  for version in matches
+                  if version not in EXCLUDE_VERSIONS)
 
 
 def fetch_source_headers() -> UnicodeVersionRstRenderCtx:
@@ -332,47 +422,59 @@ def fetch_source_headers() -> UnicodeVersionRstRenderCtx:
     return UnicodeVersionRstRenderCtx(headers)
 
 
+# cached, as it is also required by fetch_table_vs16_data(), computed concurrently
+@cache_concurrent
 def fetch_table_wide_data() -> UnicodeTableRenderCtx:
     """Fetch east-asian tables."""
-    table: dict[UnicodeVersion, TableDef] = {}
-    for version in fetch_unicode_versions():
-        # parse typical 'wide' characters by categories 'W' and 'F',
-        table[version] = parse_category(fname=UnicodeDataFile.EastAsianWidth(version),
-                                        wide=2)
-
-        # subtract(!) wide characters that were defined above as 'W' category in EastAsianWidth,
-        # but also zero-width category 'Mn' or 'Mc' in DerivedGeneralCategory!
-        table[version].values = table[version].values.difference(parse_category(
-            fname=UnicodeDataFile.DerivedGeneralCategory(version),
-            wide=0).values)
-
-        # Also subtract Hangul Jamo Vowels and Hangul Trailing Consonants
-        table[version].values = table[version].values.difference(HANGUL_JAMO_ZEROWIDTH)
-
-        # finally, join with atypical 'wide' characters defined by category 'Sk',
-        table[version].values.update(parse_category(fname=UnicodeDataFile.DerivedGeneralCategory(version),
-                                                    wide=2).values)
+    versions = fetch_unicode_versions()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        table = dict(zip(versions, executor.map(_fetch_table_wide_version, versions)))
     return UnicodeTableRenderCtx('WIDE_EASTASIAN', table)
 
 
+def _fetch_table_wide_version(version: UnicodeVersion) -> TableDef:
+    """Fetch and parse east-asian table of a single unicode version."""
+    # parse typical 'wide' characters by categories 'W' and 'F',
+    table_def = parse_category(fname=UnicodeDataFile.EastAsianWidth(version), wide=2).copy()
+
+    # subtract(!) wide characters that were defined above as 'W' category in EastAsianWidth,
+    # but also zero-width category 'Mn' or 'Mc' in DerivedGeneralCategory!
+    table_def.values = subtract_ranges(table_def.values, parse_category(
+        fname=UnicodeDataFile.DerivedGeneralCategory(version),
+        wide=0).values)
+
+    # Also subtract Hangul Jamo Vowels and Hangul Trailing Consonants
+    table_def.values = subtract_ranges(table_def.values, HANGUL_JAMO_ZEROWIDTH)
+
+    # finally, join with atypical 'wide' characters defined by category 'Sk',
+    table_def.values.extend(parse_category(fname=UnicodeDataFile.DerivedGeneralCategory(version),
+                                           wide=2).values)
+    return table_def
+
+
 def fetch_table_zero_data() -> UnicodeTableRenderCtx:
     """
     Fetch zero width tables.
 
     See also: https://unicode.org/L2/L2002/02368-default-ignorable.html
     """
-    table: dict[UnicodeVersion, TableDef] = {}
-    for version in fetch_unicode_versions():
-        # Determine values of zero-width character lookup table by the following category codes
-        table[version] = parse_category(fname=UnicodeDataFile.DerivedGeneralCategory(version),
-                                        wide=0)
+    versions = fetch_unicode_versions()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        table = dict(zip(versions, executor.map(_fetch_table_zero_version, versions)))
+    return UnicodeTableRenderCtx('ZERO_WIDTH', table)
 
-        # Include NULL
-        table[version].values.add(0)
 
-        # Add Hangul Jamo Vowels and Hangul Trailing Consonants
-        table[version].values.update(HANGUL_JAMO_ZEROWIDTH)
-    return UnicodeTableRenderCtx('ZERO_WIDTH', table)
+def _fetch_table_zero_version(version: UnicodeVersion) -> TableDef:
+    """Fetch and parse zero width table of a single unicode version."""
+    # Determine values of zero-width character lookup table by the following category codes
+    table_def = parse_category(fname=UnicodeDataFile.DerivedGeneralCategory(version), wide=0).copy()
+
+    # Include NULL
+    table_def.values.append((0, 0))
+
+    # Add Hangul Jamo Vowels and Hangul Trailing Consonants
+    table_def.values.extend(HANGUL_JAMO_ZEROWIDTH)
+    return table_def
 
 
 def fetch_table_vs16_data() -> UnicodeTableRenderCtx:
@@ -427,17 +529,14 @@ def fetch_table_vs16_data() -> UnicodeTableRenderCtx:
                                              ubound_unicode_version=unicode_version)
 
     # parse and join the final emoji release 12.0 of the earlier "type"
-    table[unicode_version].values.update(
+    table[unicode_version].values.extend(
         parse_vs16_data(fname=UnicodeDataFile.LegacyEmojiVariationSequences(),
                         ubound_unicode_version=unicode_version).values)
 
     # perform culling on any values that are already understood as 'wide'
     # without the variation-16 selector
-    wide_table = wide_tables[unicode_version].as_value_ranges()
-    table[unicode_version].values = {
-        ucs for ucs in table[unicode_version].values
-        if not _bisearch(ucs, wide_table)
-    }
+    table[unicode_version].values = subtract_ranges(table[unicode_version].values,
+                                                    wide_tables[unicode_version].values)
 
     return UnicodeTableRenderCtx('VS16_NARROW_TO_WIDE', table)
 
@@ -448,7 +547,7 @@ def parse_vs16_data(fname: str, ubound_unicode_version: UnicodeVersion):
         # pull "date string"
         date = next(table_iter).comment.split(':', 1)[1].strip()
         # pull values only matching this unicode version and lower
-        values = {entry.code_range[0] for entry in table_iter}
+        values = [entry.code_range for entry in table_iter]
     return TableDef(ubound_unicode_version, date, values)
 
 
@@ -465,11 +564,25 @@ def cite_source_description(filename: str) -> tuple[str, str]:
     return fname, date
 
 
+# cached, as the same codepoints are described again in every version of each table
+@functools.cache
 def name_ucs(ucs: str) -> str:
-    try:
-        return string.capwords(unicodedata.name(ucs))
-    except ValueError:
-        return None
+    """Return capitalized name of given unicode character, or None if it has no name."""
+    return string.capwords(unicodedata.name(ucs, '')) or None
+
+
+# cached, as most ranges are unchanged between versions of each table
+@functools.cache
+def hex_range_description(start: int, end: int) -> tuple[str, str, str]:
+    """Return (hex_start, hex_end, txt_description) of given range of codepoints."""
+    hex_start, hex_end = f'0x{start:05x}', f'0x{end:05x}'
+    name_start = name_ucs(chr(start)) or '(nil)'
+    name_end = name_ucs(chr(end)) or '(nil)'
+    if name_start != name_end:
+        txt_description = name_start[:24].rstrip().ljust(24) + '..' + name_end[:24].rstrip()
+    else:
+        txt_description = name_start[:48]
+    return hex_start, hex_end, txt_description
 
 
 def parse_unicode_table(file: Iterable[str]) -> Iterator[TableEntry]:
@@ -491,11 +604,29 @@ def parse_unicode_table(file: Iterable[str]) -> Iterator[TableEntry]:
             start, end = code_points_str.split('..')
         else:
             start = end = code_points_str
-        code_range = (int(start, base=16), int(end, base=16) + 1)
+        code_range = (int(start, base=16), int(end, base=16))
 
         yield TableEntry(code_range, tuple(properties), comment)
 
 
+# cached, as the same range boundaries recur in every version of each table
+@functools.cache
+def hex_codepoint(hex_str: str) -> int:
+    """Return codepoint of given hexadecimal string."""
+    return int(hex_str, 16)
+
+
+def parse_unicode_text(text: str, pattern: re.Pattern[str]) -> Iterator[TableEntry]:
+    """
+    Parse data lines of unicode tables having a single property, such as EastAsianWidth.txt.
+
+    Like :func:`parse_unicode_table`, but by a single regular expression scan of the whole text
+    with given pattern, which captures (start, end, property, comment) of each data line to yield.
+    """
+    for start, end, prop, comment in pattern.findall(text):
+        yield TableEntry((hex_codepoint(start), hex_codepoint(end or start)), (prop,), comment)
+
+
 def parse_vs16_table(fp: Iterable[str]) -> Iterator[TableEntry]:
     """Parse emoji-variation-sequences.txt for codepoints that precede 0xFE0F."""
     hex_str_vs16 = 'FE0F'
@@ -515,21 +646,30 @@ def parse_vs16_table(fp: Iterable[str]) -> Iterator[TableEntry]:
             yield TableEntry((int(code_points[0], 16), int(code_points[0], 16)), tuple(properties), comment)
 
 
-@functools.cache
-def parse_category(fname: str, wide: int) -> TableDef:
-    """Parse value ranges of unicode data files, by given categories into string tables."""
-    print(f'parsing {fname}, wide={wide}: ', end='', flush=True)
+@cache_concurrent
+def parse_category_widths(fname: str) -> dict[int, TableDef]:
+    """
+    Parse value ranges of unicode data files, keyed by displayed width of their categories.
 
+    Each file is parsed just once for all widths, shared by the tables of every width. Narrow
+    categories are not parsed, so that only widths 0 and 2 are returned.
+    """
     with open(fname, encoding='utf-8') as f:
-        table_iter = parse_unicode_table(f)
-
         # pull "version string" from first line of source file
-        version = next(table_iter).comment.strip()
+        version = f.readline().lstrip('#').strip()
         # and "date string" from second line
-        date = next(table_iter).comment.split(':', 1)[1].strip()
-        values = TableEntry.parse_width_category_values(table_iter, wide)
-    print('ok')
-    return TableDef(version, date, values)
+        date = f.readline().split(':', 1)[1].strip()
+        text = f.read()
+    values = TableEntry.parse_width_category_values(
+        parse_unicode_text(text, PATTERN_DATA_LINE_NOT_NARROW))
+    # a single write, print() would write the newline apart from the text of a concurrent thread
+    sys.stdout.write(f'parsing {fname}: ok\n')
+    return {wide: TableDef(version, date, values[wide]) for wide in (0, 2)}
+
+
+def parse_category(fname: str, wide: int) -> TableDef:
+    """Parse value ranges of unicode data files of given width, 0 or 2, into string tables."""
+    return parse_category_widths(fname)[wide]
 
 
 class UnicodeDataFile:
@@ -542,7 +682,15 @@ class UnicodeDataFile:
     Because file modification times are used, for local files of TestEmojiZWJSequences and
     TestEmojiVariationSequences, these files should be forcefully re-fetched CLI argument '--no-
     check-last-modified'.
+
+    Files are only retrieved again when modified, by conditional request. The time of each request
+    is recorded in PATH_LAST_MODIFIED, and a url is not requested again for LAST_MODIFIED_TTL
+    seconds.
     """
+    # protects the shared state of concurrent threads, below and in PATH_LAST_MODIFIED
+    _lock = threading.Lock()
+    _retrieve_locks: dict[str, threading.Lock] = collections.defaultdict(threading.Lock)
+
     URL_DERIVED_AGE = 'https://www.unicode.org/Public/UCD/latest/ucd/DerivedAge.txt'
     URL_EASTASIAN_WIDTH = 'https://www.unicode.org/Public/{version}/ucd/EastAsianWidth.txt'
     URL_DERIVED_CATEGORY = 'https://www.unicode.org/Public/{version}/ucd/extracted/DerivedGeneralCategory.txt'
@@ -597,59 +745,113 @@ class UnicodeDataFile:
 
     @staticmethod
     def do_retrieve(url: str, fname: str) -> None:
-        """Retrieve given url to target filepath fname."""
+        """Retrieve given url to target filepath fname, unless not modified since last retrieval."""
         folder = os.path.dirname(fname)
-        if folder and not os.path.exists(folder):
-            os.makedirs(folder)
-        if not UnicodeDataFile.is_url_newer(url, fname):
-            return
-        session = UnicodeDataFile.get_http_session()
-        resp = session.get(url, timeout=CONNECT_TIMEOUT)
-        resp.raise_for_status()
-        print(f"saving {fname}: ", end='', flush=True)
-        with open(fname, 'wb') as fout:
-            for chunk in resp.iter_content(FETCH_BLOCKSIZE):
-                fout.write(chunk)
-        print('ok')
+        if folder:
+            # may be called concurrently by fetch_table_*_data()
+            os.makedirs(folder, exist_ok=True)
+        # the same file may be retrieved concurrently for different tables
+        with UnicodeDataFile._lock:
+            retrieve_lock = UnicodeDataFile._retrieve_locks[fname]
+        with retrieve_lock:
+            UnicodeDataFile._do_retrieve(url, fname)
 
     @staticmethod
-    def is_url_newer(url: str, fname: str) -> bool:
-        if not os.path.exists(fname):
-            return True
-        if '--no-check-last-modified' not in sys.argv[1:]:
-            session = UnicodeDataFile.get_http_session()
-            resp = session.head(url, timeout=CONNECT_TIMEOUT)
+    def _do_retrieve(url: str, fname: str) -> None:
+        headers = {}
+        # ETag of this local file, not of another copy retrieved from the same url
+        previous = UnicodeDataFile.get_checked(fname)
+        etag = previous.get('etag')
+        if os.path.exists(fname):
+            if ('--no-check-last-modified' in sys.argv[1:]
+                    or UnicodeDataFile.is_recently_checked(fname)):
+                return
+            # a single conditional GET request, answered by '304 Not Modified'
+            # without any body when the remote file is not newer than local file.
+            headers['If-Modified-Since'] = email.utils.formatdate(os.path.getmtime(fname),
+                                                                  usegmt=True)
+            if etag:
+                # preferred by servers over If-Modified-Since, when given
+                headers['If-None-Match'] = etag
+        session = UnicodeDataFile.get_http_session()
+        with session.get(url, headers=headers, timeout=CONNECT_TIMEOUT, stream=True) as resp:
             resp.raise_for_status()
-            remote_url_dt = dateutil.parser.parse(resp.headers['Last-Modified']).astimezone()
-            local_file_dt = datetime.datetime.fromtimestamp(os.path.getmtime(fname)).astimezone()
-            return remote_url_dt > local_file_dt
-        return False
+            if resp.status_code != requests.codes.not_modified:
+                # copy directly from the socket, still decoding any gzip Content-Encoding
+                resp.raw.decode_content = True
+                with open(fname, 'wb') as fout:
+                    shutil.copyfileobj(resp.raw, fout, FETCH_BLOCKSIZE)
+                sys.stdout.write(f'saving {fname}: ok\n')
+                etag = resp.headers.get('ETag')
+            else:
+                # a '304 Not Modified' response need not repeat its ETag, keep the one recorded
+                etag = resp.headers.get('ETag', etag)
+            UnicodeDataFile.set_checked(fname, etag)
+
+    @staticmethod
+    def get_checked(fname: str) -> dict[str, Any]:
+        """Return entry recorded in PATH_LAST_MODIFIED for fname, empty if never checked."""
+        # keyed by local file, the same url may be retrieved to more than one file
+        return UnicodeDataFile.get_last_modified_table().get(os.path.relpath(fname, PATH_UP), {})
+
+    @staticmethod
+    def is_recently_checked(fname: str) -> bool:
+        """Whether fname was retrieved or found not modified within LAST_MODIFIED_TTL seconds."""
+        entry = UnicodeDataFile.get_checked(fname)
+        return bool(entry) and time.time() - entry['checked_at'] < LAST_MODIFIED_TTL
+
+    @staticmethod
+    def set_checked(fname: str, etag: str | None) -> None:
+        """Record in PATH_LAST_MODIFIED that fname was checked, with its ETag."""
+        last_modified_table = UnicodeDataFile.get_last_modified_table()
+        with UnicodeDataFile._lock:
+            last_modified_table[os.path.relpath(fname, PATH_UP)] = {
+                'etag': etag,
+                'checked_at': time.time()}
+            # replaced at once, so that an interrupted run cannot leave a partially written file
+            path_tmp = f'{PATH_LAST_MODIFIED}.tmp'
+            with open(path_tmp, 'w', encoding='utf-8') as fout:
+                json.dump(last_modified_table, fout, indent=4, sort_keys=True)
+            os.replace(path_tmp, PATH_LAST_MODIFIED)
 
-    @functools.cache
+    @staticmethod
+    @cache_concurrent
+    def get_last_modified_table() -> dict[str, dict[str, Any]]:
+        """Return table of PATH_LAST_MODIFIED, loaded once and shared by all threads."""
+        try:
+            with open(PATH_LAST_MODIFIED, encoding='utf-8') as fin:
+                return json.load(fin)
+        except (FileNotFoundError, ValueError):
+            # missing, or not valid json, such as left by a run interrupted by an earlier
+            # version of this script: treat every file as not yet checked.
+            return {}
+
+    @staticmethod
+    @cache_concurrent
     def get_http_session() -> requests.Session:
+        """Return HTTP session, created once and shared by all threads."""
         session = requests.Session()
         retries = urllib3.util.Retry(total=MAX_RETRIES,
                                      backoff_factor=BACKOFF_FACTOR,
                                      status_forcelist=[500, 502, 503, 504])
-        session.mount('https://', requests.adapters.HTTPAdapter(max_retries=retries))
+        # keep one connection alive for each worker of fetch_table_wide_data() and
+        # fetch_table_zero_data(), which run concurrently, and fetch_table_vs16_data().
+        pool_maxsize = 2 * MAX_WORKERS + 1
+        session.mount('https://', requests.adapters.HTTPAdapter(max_retries=retries,
+                                                                pool_maxsize=pool_maxsize))
         return session
 
     @staticmethod
     def filenames() -> list[str]:
         """Return list of UnicodeData files stored in PATH_DATA, sorted by version number."""
-        pattern = re.compile(
-            r'^(emoji-variation-sequences|DerivedGeneralCategory|EastAsianWidth)-(\d+)\.(\d+)\.(\d+).txt$')
-        filename_matches = []
+        # decorated by (name, major, minor, micro), sorted as plain tuples
+        decorated_filenames: list[tuple[str, int, int, int, str]] = []
         for fname in os.listdir(PATH_DATA):
-            if match := re.search(pattern, fname):
-                filename_matches.append(match)
-        filename_matches.sort(key=lambda m: (
-            m.group(1),
-            int(m.group(2)),
-            int(m.group(3)),
-            int(m.group(4)),
-        ))
-        return [os.path.join(PATH_DATA, match.string) for match in filename_matches]
+            if match := PATTERN_DATA_FILENAME.match(fname):
+                name, major, minor, micro = match.groups()
+                decorated_filenames.append((name, int(major), int(minor), int(micro), fname))
+        decorated_filenames.sort()
+        return [os.path.join(PATH_DATA, fname) for *_, fname in decorated_filenames]
 
 
 def main() -> None:
@@ -658,21 +860,44 @@ def main() -> None:
     # and what function defines the source data. We hope to add more source
     # language options using jinja2 templates, with minimal modification of the
     # code.
-    def get_codegen_definitions() -> Iterator[RenderDefinition]:
-        yield UnicodeVersionPyRenderDef.new(
+    codegen_definitions: list[Callable[[], RenderDefinition]] = [
+        lambda: UnicodeVersionPyRenderDef.new(
             UnicodeVersionPyRenderCtx(fetch_unicode_versions())
-        )
-        yield UnicodeTableRenderDef.new('table_vs16.py', fetch_table_vs16_data())
-        yield UnicodeTableRenderDef.new('table_wide.py', fetch_table_wide_data())
-        yield UnicodeTableRenderDef.new('table_zero.py', fetch_table_zero_data())
-        yield UnicodeVersionRstRenderDef.new(fetch_source_headers())
-
-    for render_def in get_codegen_definitions():
-        with open(render_def.output_filename, 'w', encoding='utf-8', newline='\n') as fout:
-            print(f'write {render_def.output_filename}: ', flush=True, end='')
-            for data in render_def.generate():
-                fout.write(data)
-            print('ok')
+        ),
+        lambda: UnicodeTableRenderDef.new('table_vs16.py', fetch_table_vs16_data()),
+        lambda: UnicodeTableRenderDef.new('table_wide.py', fetch_table_wide_data()),
+        lambda: UnicodeTableRenderDef.new('table_zero.py', fetch_table_zero_data()),
+    ]
+
+    def write_codegen(get_render_def: Callable[[], RenderDefinition]) -> None:
+        render_def = get_render_def()
+        text = render_def.render()
+        # do not touch files that differ only by the time they were generated, so that their
+        # modification time, and any byte-compiled or other derived files, remain current.
+        try:
+            with open(render_def.output_filename, encoding='utf-8', newline='\n') as fin:
+                previous_text = fin.read()
+        except FileNotFoundError:
+            pass
+        else:
+            if PATTERN_UTC_NOW.sub(utc_now(), previous_text, count=1) == text:
+                sys.stdout.write(f'write {render_def.output_filename}: unchanged\n')
+                return
+        # written in binary mode, encoded at once and without any newline translation
+        with open(render_def.output_filename, 'wb') as fout:
+            fout.write(text.encode('utf-8'))
+        # like parse_category_widths(), a single write, as concurrent threads write messages
+        sys.stdout.write(f'write {render_def.output_filename}: ok\n')
+
+    # all definitions depend on the unicode versions of DerivedAge.txt, fetch them first, then
+    # fetch, parse, and write each definition concurrently.
+    fetch_unicode_versions()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(codegen_definitions)) as executor:
+        # exhaust the results, so that any exception is raised
+        list(executor.map(write_codegen, codegen_definitions))
+
+    # The rst file cites every file of PATH_DATA, written only once all others are retrieved
+    write_codegen(lambda: UnicodeVersionRstRenderDef.new(fetch_source_headers()))
 
     # fetch latest test data files
     UnicodeDataFile.TestEmojiVariationSequences()